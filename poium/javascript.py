@@ -2,6 +2,9 @@ from poium.common import logging
 from poium.common.exceptions import CSSFindElementError
 from selenium.common.exceptions import JavascriptException
 
+# Finds the element, the css selector and index are the first script arguments
+ELEMENT_JS = "var elm = document.querySelectorAll(arguments[0])[arguments[1]];\n"
+
 
 class CSSElement(object):
     """
@@ -28,14 +31,19 @@ class CSSElement(object):
             return None
         global driver
         driver = instance.driver
+        invalidate_cache = getattr(instance, "invalidate_cache", None)
+        if invalidate_cache is not None:
+            invalidate_cache()
         return self
 
-    def _execute_javascript(self, js):
+    def _execute_javascript(self, js, *args):
         """
-        Run the javascript script
+        Run the javascript script,
+        the script finds the element in ``elm`` and gets ``args`` from arguments[2] on.
         """
+        js = ELEMENT_JS + js
         try:
-            driver.execute_script(js)
+            driver.execute_script(js, self.css, int(self.index), *args)
         except JavascriptException:
             raise CSSFindElementError("Element discovery failure. ", js)
 
@@ -45,9 +53,8 @@ class CSSElement(object):
         Clears the text if it's a text entry element, Only support css positioning
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                    elm.style.border="2px solid red";
-                    elm.value = "";""".format(css=self.css, index=self.index)
+        js = """elm.style.border="2px solid red";
+                    elm.value = "";"""
         self._execute_javascript(js)
 
     def set_text(self, value):
@@ -57,10 +64,9 @@ class CSSElement(object):
         :param value: input text
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                    elm.style.border="2px solid red";
-                    elm.value = "{value}";""".format(css=self.css, index=self.index, value=value)
-        self._execute_javascript(js)
+        js = """elm.style.border="2px solid red";
+                    elm.value = arguments[2];"""
+        self._execute_javascript(js, str(value))
 
     def click(self):
         """
@@ -68,9 +74,8 @@ class CSSElement(object):
         Click element.
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                   elm.style.border="2px solid red";
-                   elm.click();""".format(css=self.css, index=self.index)
+        js = """elm.style.border="2px solid red";
+                   elm.click();"""
         self._execute_javascript(js)
 
     def click_display(self):
@@ -79,7 +84,7 @@ class CSSElement(object):
         Click on the displayed element, otherwise skip it.
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = 'var elm = document.querySelector("' + self.css + '");' \
+        js = 'elm = document.querySelector(arguments[0]);' \
              ' if(elm != null){elm.style.border="2px solid red";elm.click();}'
         self._execute_javascript(js)
 
@@ -89,8 +94,7 @@ class CSSElement(object):
         Display hidden elements
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                    elm.style.display = "block";""".format(css=self.css, index=self.index)
+        js = """elm.style.display = "block";"""
         self._execute_javascript(js)
 
     def remove_attribute(self, attribute):
@@ -100,9 +104,8 @@ class CSSElement(object):
         :param attribute:
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                    elm.removeAttribute("{attr}");""".format(css=self.css, index=self.index, attr=attribute)
-        self._execute_javascript(js)
+        js = """elm.removeAttribute(arguments[2]);"""
+        self._execute_javascript(js, attribute)
 
     def set_attribute(self, attribute, value):
         """
@@ -112,10 +115,8 @@ class CSSElement(object):
         :param value:
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                    elm.setAttribute("{attr}", "{value}");
-                    """.format(css=self.css, index=self.index, attr=attribute, value=value)
-        self._execute_javascript(js)
+        js = """elm.setAttribute(arguments[2], arguments[3]);"""
+        self._execute_javascript(js, attribute, str(value))
 
     def clear_style(self):
         """
@@ -123,8 +124,7 @@ class CSSElement(object):
         Clear element styles.
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                    elm.style="";""".format(css=self.css, index=self.index)
+        js = """elm.style="";"""
         self._execute_javascript(js)
 
     def clear_class(self):
@@ -133,8 +133,7 @@ class CSSElement(object):
         Clear element class
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{index}];
-                     elm.removeAttribute("class");""".format(css=self.css, index=self.index)
+        js = """elm.removeAttribute("class");"""
         self._execute_javascript(js)
 
     def inner_text(self, text):
@@ -144,9 +143,8 @@ class CSSElement(object):
         :param text: Inserted text
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{i}];
-                     elm.innerText="{text}";""".format(css=self.css, i=self.index, text=text)
-        self._execute_javascript(js)
+        js = """elm.innerText=arguments[2];"""
+        self._execute_javascript(js, str(text))
 
     def remove_child(self, child=0):
         """
@@ -155,9 +153,8 @@ class CSSElement(object):
         :param child: child of the child node
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{i}];
-                    elm.removeChild(elm.childNodes[{child}]);""".format(css=self.css, i=self.index, child=str(child))
-        self._execute_javascript(js)
+        js = """elm.removeChild(elm.childNodes[arguments[2]]);"""
+        self._execute_javascript(js, int(child))
 
     def click_parent(self):
         """
@@ -165,24 +162,26 @@ class CSSElement(object):
         Click the parent element of the element
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{i}];
-                    elm.parentElement.click();""".format(css=self.css, i=self.index)
+        js = """elm.parentElement.click();"""
         self._execute_javascript(js)
 
     def scroll(self, top=0, left=0):
         """
         JavaScript API, Only support css positioning
-        scroll the div element on the page
+        scroll the div element on the page,
+        strings are inserted into the script as JavaScript expressions
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
         if top != 0:
-            js = """var elm = document.querySelectorAll("{css}")[{i}];
-                    elm.scrollTop={t};""".format(css=self.css, i=self.index, t=top)
-            self._execute_javascript(js)
+            if isinstance(top, str):
+                self._execute_javascript("elm.scrollTop={t};".format(t=top))
+            else:
+                self._execute_javascript("elm.scrollTop=arguments[2];", top)
         if left != 0:
-            js = """var elm = document.querySelectorAll("{css}")[{i}];
-                    elm.scrollLeft={l};""".format(css=self.css, i=self.index, l=left)
-            self._execute_javascript(js)
+            if isinstance(left, str):
+                self._execute_javascript("elm.scrollLeft={l};".format(l=left))
+            else:
+                self._execute_javascript("elm.scrollLeft=arguments[2];", left)
 
     def move_to(self):
         """
@@ -190,7 +189,5 @@ class CSSElement(object):
         Move the mouse over the element
         """
         logging.info("Element of the current operation: {desc}".format(desc=self.desc))
-        js = """var elm = document.querySelectorAll("{css}")[{i}];
-                    elm.dispatchEvent(new Event("mouseover"));""".format(css=self.css, i=self.index)
+        js = """elm.dispatchEvent(new Event("mouseover"));"""
         self._execute_javascript(js)
-
@@ -1,3 +1,4 @@
+import weakref
 import warnings
 import platform
 from time import sleep
@@ -42,6 +43,23 @@ LOCATOR_LIST = {
     'custom': MobileBy.CUSTOM,
 }
 
+# Modifier key of the select all/cut/copy/paste shortcuts, resolved once
+MODIFIER_KEY = Keys.COMMAND if platform.system().lower() == "darwin" else Keys.CONTROL
+
+# Session state cached per driver, shared by all the pages using the driver
+_DRIVER_STATES = weakref.WeakKeyDictionary()
+
+
+def driver_state(driver):
+    """
+    Returns the dict of session state cached for the driver.
+    """
+    try:
+        return _DRIVER_STATES.setdefault(driver, {})
+    except TypeError:
+        # the driver can't be weakly referenced, cache nothing
+        return {}
+
 
 class PageObject(object):
     """
@@ -64,7 +82,10 @@ class PageObject(object):
         """
         root_uri = self.root_uri or ''
         self.driver.get(root_uri + uri)
-        self.driver.implicitly_wait(5)
+        session = driver_state(self.driver)
+        if session.get("implicit_wait") != 5:
+            self.driver.implicitly_wait(5)
+            session["implicit_wait"] = 5
 
 
 class Element(object):
@@ -91,6 +112,9 @@ class Element(object):
             return None
 
         Browser.driver = instance.driver
+        invalidate_cache = getattr(instance, "invalidate_cache", None)
+        if invalidate_cache is not None:
+            invalidate_cache()
         return self
 
     def __set__(self, instance, value):
@@ -456,31 +480,19 @@ class Element(object):
 
     def select_all(self):
         elem = self.__get_element(self.k, self.v)
-        if platform.system().lower() == "darwin":
-            elem.send_keys(Keys.COMMAND, "a")
-        else:
-            elem.send_keys(Keys.CONTROL, "a")
+        elem.send_keys(MODIFIER_KEY, "a")
 
     def cut(self):
         elem = self.__get_element(self.k, self.v)
-        if platform.system().lower() == "darwin":
-            elem.send_keys(Keys.COMMAND, "x")
-        else:
-            elem.send_keys(Keys.CONTROL, "x")
+        elem.send_keys(MODIFIER_KEY, "x")
 
     def copy(self):
         elem = self.__get_element(self.k, self.v)
-        if platform.system().lower() == "darwin":
-            elem.send_keys(Keys.COMMAND, "c")
-        else:
-            elem.send_keys(Keys.CONTROL, "c")
+        elem.send_keys(MODIFIER_KEY, "c")
 
     def paste(self):
         elem = self.__get_element(self.k, self.v)
-        if platform.system().lower() == "darwin":
-            elem.send_keys(Keys.COMMAND, "v")
-        else:
-            elem.send_keys(Keys.CONTROL, "v")
+        elem.send_keys(MODIFIER_KEY, "v")
 
     def backspace(self):
         elem = self.__get_element(self.k, self.v)
@@ -536,6 +548,10 @@ class Elements(object):
         if not context:
             context = instance.driver
 
+        invalidate_cache = getattr(instance, "invalidate_cache", None)
+        if invalidate_cache is not None:
+            invalidate_cache()
+
         return self.find(context)
 
     def __set__(self, instance, value):
@@ -1,13 +1,22 @@
 import os
+import json
 import time
+import asyncio
 import warnings
+from contextlib import contextmanager
 from time import sleep
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_input import PointerInput
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.common.exceptions import NoAlertPresentException
+from selenium.common.exceptions import NoSuchWindowException
+from selenium.common.exceptions import WebDriverException
 from appium.webdriver.common.touch_action import TouchAction as MobileTouchAction
 
 from poium.page_objects import PageObject
+from poium.page_objects import driver_state
 
 
 class Page(PageObject):
@@ -16,26 +25,149 @@ class Page(PageObject):
     and selenium/appium extension APIs。
     """
 
+    # constant script source, the values are passed as arguments
+    _SCROLL_JS = "window.scrollTo(arguments[0], arguments[1]);"
+    # seconds cookie reads are cached, cookies set by the server show up after it
+    _COOKIE_TTL = 0.5
+
+    def __init__(self, driver, url=None):
+        super().__init__(driver, url)
+        # webview context found by switch_to_web()
+        self._webview_ctx = None
+        # pending ActionChains, see begin_actions()
+        self._actions = None
+        # default directory of screenshots(), resolved once
+        self._screenshot_dir = os.getcwd()
+
+    @property
+    def _session(self):
+        """
+        Session state cached for the driver, shared with the other pages using it.
+        """
+        return driver_state(self.driver)
+
+    @property
+    def _nav_version(self):
+        """
+        Bumped whenever the page may have changed, see invalidate_cache().
+        """
+        return self._session.get("nav_version", 0)
+
+    def invalidate_cache(self):
+        """
+        Drop the cached page state (cookies, alert) of the driver.
+        Poium calls it on every page operation that may change the page:
+        navigating, running scripts, mouse/touch actions, alerts, switching
+        frames/windows/contexts or using an element.
+        Call it after changing the page through the driver directly.
+        """
+        session = self._session
+        session["nav_version"] = session.get("nav_version", 0) + 1
+        # True once an alert is known to be open
+        self._session.pop("alert_present", None)
+
+    def get(self, uri):
+        """
+        :param uri:  URI to GET, based off of the root_uri attribute.
+        """
+        self.invalidate_cache()
+        super().get(uri)
+
     def execute_script(self, js=None, *args):
         """
         Execute JavaScript scripts.
         """
         if js is None:
             raise ValueError("Please input js script")
-        
+
+        self.invalidate_cache()
         return self.driver.execute_script(js, *args)
 
+    @staticmethod
+    def sleep(sec):
+        """
+        Sleep for ``sec`` seconds, blocking the thread.
+        Use asleep() inside coroutines.
+        """
+        time.sleep(sec)
+
+    @staticmethod
+    async def asleep(sec):
+        """
+        Sleep for ``sec`` seconds without blocking the event loop.
+        :Usage:
+            await page.asleep(1)
+        """
+        await asyncio.sleep(sec)
+
+    def wait(self, secs=10):
+        """
+        selenium API
+        Sets a sticky timeout to implicitly wait for an element to be found.
+        The request is skipped when the timeout is unchanged.
+        :param secs: Amount of time to wait (in seconds)
+        """
+        session = self._session
+        if secs != session.get("implicit_wait"):
+            self.driver.implicitly_wait(secs)
+            session["implicit_wait"] = secs
+
+    def wait_script_timeout(self, secs):
+        """
+        selenium API
+        Set the amount of time that the script should wait during an
+        execute_async_script call before throwing an error.
+        The request is skipped when the timeout is unchanged.
+        :param secs: The amount of time to wait (in seconds)
+        """
+        session = self._session
+        if secs != session.get("script_timeout"):
+            self.driver.set_script_timeout(secs)
+            session["script_timeout"] = secs
+
+    def wait_page_load_timeout(self, secs):
+        """
+        selenium API
+        Set the amount of time to wait for a page load to complete
+        before throwing an error.
+        The request is skipped when the timeout is unchanged.
+        :param secs: The amount of time to wait (in seconds)
+        """
+        session = self._session
+        if secs != session.get("page_load_timeout"):
+            self.driver.set_page_load_timeout(secs)
+            session["page_load_timeout"] = secs
+
     def window_scroll(self, width=None, height=None):
         """
         JavaScript API, Only support css positioning
         Setting width and height of window scroll bar.
+        Numbers are passed as script arguments, strings are inserted into the
+        script as JavaScript expressions, e.g. "document.body.scrollHeight".
+        """
+        self.execute_script(*self._scroll_script(width, height))
+
+    @classmethod
+    def _scroll_script(cls, width, height):
+        """
+        Returns the window scroll script followed by its arguments.
         """
         if width is None:
-            width = "0"
+            width = 0
         if height is None:
-            height = "0"
-        js = "window.scrollTo({w},{h});".format(w=str(width), h=(height))
-        self.execute_script(js)
+            height = 0
+        if isinstance(width, str) or isinstance(height, str):
+            return ["window.scrollTo({w},{h});".format(w=width, h=height)]
+        return [cls._SCROLL_JS, width, height]
+
+    def get_page_meta(self):
+        """
+        JavaScript API
+        Get page title and URL with one script call.
+        :return: (title, URL)
+        """
+        js = "return [document.title, document.URL];"
+        return tuple(self.driver.execute_script(js))
 
     @property
     def get_title(self):
@@ -44,7 +176,7 @@ class Page(PageObject):
         Get page title.
         """
         js = 'return document.title;'
-        return self.execute_script(js)
+        return self.driver.execute_script(js)
 
     @property
     def get_url(self):
@@ -53,7 +185,7 @@ class Page(PageObject):
         Get page URL.
         """
         js = "return document.URL;"
-        return self.execute_script(js)
+        return self.driver.execute_script(js)
 
     def set_window_size(self, width=None, height=None):
         """
@@ -67,10 +199,13 @@ class Page(PageObject):
         :Usage:
             driver.set_window_size(800,600)
         """
+        session = self._session
         if width is None and height is None:
+            session.pop("window_size", None)
             self.driver.maximize_window()
-        else:
-            self.driver.set_window_size(self, width, height)
+        elif (width, height) != session.get("window_size"):
+            self.driver.set_window_size(width, height)
+            session["window_size"] = (width, height)
 
     def switch_to_frame(self, frame_reference):
         """
@@ -79,6 +214,7 @@ class Page(PageObject):
         """
         warnings.warn("use driver.elem.switch_to_frame() instead",
                       DeprecationWarning, stacklevel=2)
+        self.invalidate_cache()
         self.driver.switch_to.frame(frame_reference)
 
     def switch_to_parent_frame(self):
@@ -87,6 +223,7 @@ class Page(PageObject):
         Switches focus to the parent context.
         Corresponding relationship with switch_to_frame () method.
         """
+        self.invalidate_cache()
         self.driver.switch_to.parent_frame()
 
     @property
@@ -111,41 +248,95 @@ class Page(PageObject):
         """
         selenium API
         Returns the handles of all windows within the current session.
+        The list is remembered for switch_to_window(index), see there.
+        """
+        handles = self.driver.window_handles
+        self._session["window_handles"] = handles
+        return handles
+
+    def invalidate_windows(self):
+        """
+        selenium API
+        Forget the window handles remembered from the last window_handles read.
         """
-        return self.driver.window_handles
+        self._session.pop("window_handles", None)
 
     def switch_to_window(self, handle):
         """
         selenium API
         Switches focus to the specified window.
-        """
-        self.driver.switch_to.window(handle)
+        :param handle: window handle, or the index of the window.
+                       A positive index refers to the list last returned by your own
+                       window_handles/new_window_handle read, so read it again after
+                       windows were opened or closed. Without such a read, and for
+                       negative or out of range indexes, fresh handles are fetched.
+        """
+        self.invalidate_cache()
+        # the size set by set_window_size() was for the previous window
+        self._session.pop("window_size", None)
+        if isinstance(handle, int):
+            handles = self._session.get("window_handles")
+            # a negative index counts from the newest window, which may have just opened
+            if handles is None or handle < 0 or handle >= len(handles):
+                # fetched for this switch only, not remembered
+                handles = self.driver.window_handles
+            try:
+                self.driver.switch_to.window(handles[handle])
+            except NoSuchWindowException:
+                # the remembered handle was closed, retry with fresh handles
+                self.driver.switch_to.window(self.driver.window_handles[handle])
+        else:
+            self.driver.switch_to.window(handle)
 
     def screenshots(self, path=None, filename=None):
         """
         selenium API
         Saves a screenshots of the current window to a PNG image file
-        :param path: The path to save the file
+        :param path: The path to save the file,
+                     defaults to the working directory when the page was created
         :param filename: The file name
         """
         if path is None:
-            path = os.getcwd()
+            path = self._screenshot_dir
         if filename is None:
-            filename = str(time.time()).split(".")[0] + ".png"
+            filename = "{}.png".format(int(time.time()))
         file_path = os.path.join(path, filename)
         self.driver.save_screenshot(file_path)
 
+    def _cookies(self):
+        """
+        Returns the cached (cookie list, cookies by name), fetching them again
+        after the cookies or the page changed, or the cache expired.
+        """
+        session = self._session
+        # (nav version, expiry time, cookie list, cookies by name)
+        cache = session.get("cookies")
+        now = time.monotonic()
+        if cache is None or cache[0] != self._nav_version or cache[1] <= now:
+            cookies = self.driver.get_cookies()
+            by_name = {}
+            for cookie in cookies:
+                # like webdriver get_cookie, the first cookie of a name wins
+                by_name.setdefault(cookie["name"], cookie)
+            cache = session["cookies"] = (self._nav_version, now + self._COOKIE_TTL, cookies, by_name)
+        return cache[2], cache[3]
+
     def get_cookies(self):
         """
         Returns a set of dictionaries, corresponding to cookies visible in the current session.
+        The cookies are cached for a short time, until the next page operation
+        or until they are changed through the page.
         """
-        return self.driver.get_cookies()
+        cookies, _ = self._cookies()
+        return [dict(cookie) for cookie in cookies]
 
     def get_cookie(self, name):
         """
         Returns information of cookie with ``name`` as an object.
         """
-        return self.driver.get_cookie(name)
+        _, by_name = self._cookies()
+        cookie = by_name.get(name)
+        return None if cookie is None else dict(cookie)
 
     def add_cookie(self, cookie_dict):
         """
@@ -154,30 +345,61 @@ class Page(PageObject):
             add_cookie({'name' : 'foo', 'value' : 'bar'})
         """
         if isinstance(cookie_dict, dict):
+            self._session.pop("cookies", None)
             self.driver.add_cookie(cookie_dict)
         else:
             raise TypeError("Wrong cookie type.")
 
     def add_cookies(self, cookie_list):
         """
-        Adds a cookie to your current session.
+        Adds a list of cookies to your current session.
+        Chromium based drivers set them all with a single CDP command.
         Usage:
             cookie_list = [
                 {'name' : 'foo', 'value' : 'bar'},
                 {'name' : 'foo', 'value' : 'bar'}
             ]
-            add_cookie(cookie_list)
+            add_cookies(cookie_list)
         """
-        if isinstance(cookie_list, list):
-            for cookie in cookie_list:
-                self.add_cookie(cookie)
-        else:
+        if not isinstance(cookie_list, list):
+            raise TypeError("Wrong cookie type.")
+        if not all(isinstance(cookie, dict) for cookie in cookie_list):
             raise TypeError("Wrong cookie type.")
 
+        self._session.pop("cookies", None)
+        driver = self.driver
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chrome/Edge: set all the cookies with one command
+            url = None
+            if not all("domain" in cookie for cookie in cookie_list):
+                url = driver.current_url
+            cdp_cookie = self._cdp_cookie
+            cookies = [cdp_cookie(cookie, url) for cookie in cookie_list]
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        else:
+            add_cookie = driver.add_cookie
+            for cookie in cookie_list:
+                add_cookie(cookie)
+
+    @staticmethod
+    def _cdp_cookie(cookie_dict, url):
+        """
+        Convert a webdriver cookie dict to the CDP ``Network.CookieParam`` format.
+        """
+        cookie = dict(cookie_dict)
+        # webdriver add_cookie defaults the path to "/", CDP derives it from the URL
+        cookie.setdefault("path", "/")
+        if "expiry" in cookie:
+            cookie["expires"] = cookie.pop("expiry")
+        if "domain" not in cookie:
+            cookie["url"] = url
+        return cookie
+
     def delete_cookie(self, name):
         """
         Deletes a single cookie with the given name.
         """
+        self._session.pop("cookies", None)
         self.driver.delete_cookie(name)
 
     def delete_all_cookies(self):
@@ -186,14 +408,41 @@ class Page(PageObject):
         Usage:
             self.delete_all_cookies()
         """
+        self._session.pop("cookies", None)
         self.driver.delete_all_cookies()
 
+    def _switch_context(self, context):
+        """
+        appium API
+        Switch to the context, skipping the request if it's known to be the current one.
+        """
+        session = self._session
+        if session.get("context") != context:
+            self.invalidate_cache()
+            self.driver.switch_to.context(context)
+            session["context"] = context
+
+    def invalidate_context(self):
+        """
+        appium API
+        Forget the cached context,
+        call it after switching context with the driver directly.
+        """
+        self._session.pop("context", None)
+
     def switch_to_app(self):
         """
         appium API
         Switch to native app.
         """
-        self.driver.switch_to.context('NATIVE_APP')
+        self._switch_context('NATIVE_APP')
+
+    def switch_to_flutter(self):
+        """
+        appium API
+        Switch to flutter app.
+        """
+        self._switch_context('FLUTTER')
 
     def switch_to_web(self, context=None):
         """
@@ -201,15 +450,23 @@ class Page(PageObject):
         Switch to web view.
         """
         if context is not None:
-            self.driver.switch_to.context(context)
-        else:
-            all_context = self.driver.contexts
-            for context in all_context:
-                if "WEBVIEW" in context:
-                    self.driver.switch_to.context(context)
-                    break
-            else:
-                raise NameError("No WebView found.")
+            self._switch_context(context)
+            return
+
+        if self._webview_ctx is not None:
+            try:
+                self._switch_context(self._webview_ctx)
+                return
+            except WebDriverException:
+                # the cached webview is gone, look it up again
+                self._webview_ctx = None
+
+        for context in self.driver.contexts:
+            if context.startswith("WEBVIEW"):
+                self._switch_context(context)
+                self._webview_ctx = context
+                return
+        raise NameError("No WebView found.")
 
     def accept_alert(self):
         """
@@ -217,6 +474,7 @@ class Page(PageObject):
         Accept warning box.
         """
         self.driver.switch_to.alert.accept()
+        self.invalidate_cache()
 
     def dismiss_alert(self):
         """
@@ -224,18 +482,27 @@ class Page(PageObject):
         Dismisses the alert available.
         """
         self.driver.switch_to.alert.dismiss()
+        self.invalidate_cache()
 
     def alert_is_display(self):
         """
         selenium API
-        Determines if alert is displayed
+        Determines if alert is displayed.
+        An open alert stays open until it is accepted or dismissed,
+        so it's only probed again after the page is used.
         """
+        session = self._session
+        if session.get("alert_present"):
+            return True
+        # webdriver has no cheaper way to ask for an alert: execute_cdp_cmd
+        # can't subscribe to Page.javascriptDialogOpening events, and scripts
+        # fail while an alert is open, so the probe stays exception based.
         try:
-            self.driver.switch_to.alert
+            present = self.driver.switch_to.alert is not None
         except NoAlertPresentException:
             return False
-        else:
-            return True
+        session["alert_present"] = present
+        return present
 
     @property
     def get_alert_text(self):
@@ -252,6 +519,7 @@ class Page(PageObject):
         """
         warnings.warn("use driver.elem.move_to_element() instead",
                       DeprecationWarning, stacklevel=2)
+        self.invalidate_cache()
         ActionChains(self.driver).move_to_element(elem).perform()
 
     def click_and_hold(self, elem):
@@ -261,6 +529,7 @@ class Page(PageObject):
         """
         warnings.warn("use driver.elem.click_and_hold() instead",
                       DeprecationWarning, stacklevel=2)
+        self.invalidate_cache()
         ActionChains(self.driver).click_and_hold(elem).perform()
 
     def double_click(self, elem):
@@ -270,8 +539,71 @@ class Page(PageObject):
         """
         warnings.warn("use driver.elem.double_click() instead",
                       DeprecationWarning, stacklevel=2)
+        self.invalidate_cache()
         ActionChains(self.driver).double_click(elem).perform()
 
+    def begin_actions(self):
+        """
+        selenium API
+        Start collecting the actions of move_by_offset() and release(),
+        they are sent together by flush_actions().
+        Actions still pending from an earlier begin_actions() are discarded,
+        prefer action_batch() which also discards them on errors.
+
+        :Usage:
+            page.begin_actions()
+            page.move_by_offset(10, 10)
+            page.move_by_offset(20, 20, click=True)
+            page.release()
+            page.flush_actions()
+        """
+        self._actions = ActionChains(self.driver)
+
+    def flush_actions(self):
+        """
+        selenium API
+        Performs all the actions collected since begin_actions().
+        """
+        actions, self._actions = self._actions, None
+        if actions is not None:
+            self.invalidate_cache()
+            actions.perform()
+
+    def discard_actions(self):
+        """
+        selenium API
+        Drops the actions collected since begin_actions() without performing them.
+        """
+        self._actions = None
+
+    @contextmanager
+    def action_batch(self):
+        """
+        selenium API
+        Collect the actions of the block and perform them together on exit,
+        they are discarded if the block raises.
+
+        :Usage:
+            with page.action_batch():
+                page.move_by_offset(10, 10)
+                page.release()
+        """
+        self.begin_actions()
+        try:
+            yield self
+        except BaseException:
+            self.discard_actions()
+            raise
+        self.flush_actions()
+
+    def _action_chains(self):
+        """
+        Returns the pending ActionChains, or a new one to perform at once.
+        """
+        if self._actions is not None:
+            return self._actions, False
+        return ActionChains(self.driver), True
+
     def move_by_offset(self, x, y, click=False):
         """
         selenium API
@@ -281,17 +613,24 @@ class Page(PageObject):
          - x: X offset to move to, as a positive or negative integer.
          - y: Y offset to move to, as a positive or negative integer.
         """
+        actions, perform = self._action_chains()
+        actions.move_by_offset(x, y)
         if click is True:
-            ActionChains(self.driver).move_by_offset(x, y).click().perform()
-        else:
-            ActionChains(self.driver).move_by_offset(x, y).perform()
+            actions.click()
+        self.invalidate_cache()
+        if perform:
+            actions.perform()
 
     def release(self):
         """
         selenium API
         Releasing a held mouse button on an element.
         """
-        ActionChains(self.driver).release().perform()
+        actions, perform = self._action_chains()
+        actions.release()
+        self.invalidate_cache()
+        if perform:
+            actions.perform()
 
     def context_click(self, elem):
         """
@@ -300,6 +639,7 @@ class Page(PageObject):
         """
         warnings.warn("use driver.elem.context_click() instead",
                       DeprecationWarning, stacklevel=2)
+        self.invalidate_cache()
         ActionChains(self.driver).context_click(elem).perform()
 
     def drag_and_drop_by_offset(self, elem, x, y):
@@ -313,6 +653,7 @@ class Page(PageObject):
         """
         warnings.warn("use driver.elem.drag_and_drop_by_offset(x, y) instead",
                       DeprecationWarning, stacklevel=2)
+        self.invalidate_cache()
         ActionChains(self.driver).drag_and_drop_by_offset(elem, xoffset=x, yoffset=y).perform()
 
     def refresh_element(self, elem, timeout=10):
@@ -332,6 +673,7 @@ class Page(PageObject):
                 try:
                     elem
                 except StaleElementReferenceException:
+                    self.invalidate_cache()
                     self.driver.refresh()
                 else:
                     break
@@ -345,6 +687,7 @@ class Page(PageObject):
         appium API
         Perform a tap action on the element
         """
+        self.invalidate_cache()
         action = MobileTouchAction(self.driver)
         action.tap(elem, x, y, count).perform()
 
@@ -353,6 +696,7 @@ class Page(PageObject):
         appium API
         Begin a chain with a press down action at a particular element or point
         """
+        self.invalidate_cache()
         action = MobileTouchAction(self.driver)
         action.press(elem, x, y, pressure).perform()
 
@@ -361,6 +705,7 @@ class Page(PageObject):
         appium API
         Begin a chain with a press down that lasts `duration` milliseconds
         """
+        self.invalidate_cache()
         action = MobileTouchAction(self.driver)
         action.long_press(elem, x, y, duration).perform()
 
@@ -369,4 +714,117 @@ class Page(PageObject):
         appium API
         Swipe from one point to another point, for an optional duration.
         """
+        self.invalidate_cache()
         self.driver.swipe(start_x, start_y, end_x, end_y, duration)
+
+    def swipe_batch(self, points, interval=0.1):
+        """
+        appium API
+        Perform several swipes with one W3C actions request.
+        :param points: list of (start_x, start_y, end_x, end_y, duration) tuples,
+                       duration in milliseconds
+        :param interval: pause between two swipes, in seconds
+
+        :Usage:
+            page.swipe_batch([(100, 800, 100, 200, 500), (100, 800, 100, 200, 500)])
+        """
+        touch = PointerInput(interaction.POINTER_TOUCH, "touch")
+        actions = ActionBuilder(self.driver, mouse=touch)
+        pointer = actions.pointer_action
+        for start_x, start_y, end_x, end_y, duration in points:
+            pointer.move_to_location(start_x, start_y)
+            pointer.pointer_down()
+            pointer.pause((duration or 0) / 1000)
+            pointer.move_to_location(end_x, end_y)
+            pointer.release()
+            pointer.pause(interval)
+        self.invalidate_cache()
+        actions.perform()
+
+    @contextmanager
+    def batch(self):
+        """
+        appium API
+        Collect operations and send them with one appium execute_driver request.
+        window_scroll, add_cookie, move_by_offset, top and swipe are batched,
+        other page methods run immediately.
+
+        :Usage:
+            with page.batch() as batch:
+                batch.window_scroll(0, 300)
+                batch.swipe(100, 800, 100, 200, 500)
+            print(batch.results)
+        """
+        page_batch = PageBatch(self)
+        yield page_batch
+        page_batch.flush()
+
+
+class PageBatch(object):
+    """
+    Records page operations as WebdriverIO commands,
+    see http://appium.io/docs/en/commands/session/execute-driver
+    """
+
+    # each operation is a WebdriverIO command of the driver object
+    SCRIPT = """const ops = {ops};
+const results = [];
+for (const op of ops) {{
+    results.push(await driver[op.name](...op.args));
+}}
+return results;"""
+
+    def __init__(self, page):
+        self.page = page
+        self.ops = []
+        self.results = []
+
+    def __getattr__(self, name):
+        # operations that aren't batched run on the page directly,
+        # after the recorded ones so they keep their order
+        self.flush()
+        return getattr(self.page, name)
+
+    def _add(self, name, *args):
+        self.ops.append({"name": name, "args": list(args)})
+
+    def window_scroll(self, width=None, height=None):
+        self._add("execute", *Page._scroll_script(width, height))
+
+    def add_cookie(self, cookie_dict):
+        if not isinstance(cookie_dict, dict):
+            raise TypeError("Wrong cookie type.")
+        self._add("addCookie", cookie_dict)
+
+    def move_by_offset(self, x, y, click=False):
+        actions = [{"type": "pointerMove", "duration": 250, "origin": "pointer", "x": x, "y": y}]
+        if click is True:
+            actions.append({"type": "pointerDown", "button": 0})
+            actions.append({"type": "pointerUp", "button": 0})
+        self._add("performActions", [{
+            "type": "pointer",
+            "id": "mouse",
+            "parameters": {"pointerType": "mouse"},
+            "actions": actions,
+        }])
+
+    def top(self, elem, x, y, count):
+        action = MobileTouchAction().tap(elem, x, y, count)
+        self._add("touchPerform", action.json_wire_gestures)
+
+    def swipe(self, start_x, start_y, end_x, end_y, duration=None):
+        action = MobileTouchAction()
+        action.press(x=start_x, y=start_y).wait(ms=duration).move_to(x=end_x, y=end_y).release()
+        self._add("touchPerform", action.json_wire_gestures)
+
+    def flush(self):
+        """
+        Sends the recorded operations, their return values are appended to ``results``.
+        """
+        ops, self.ops = self.ops, []
+        if not ops:
+            return self.results
+        self.page.invalidate_cache()
+        script = self.SCRIPT.format(ops=json.dumps(ops))
+        self.results.extend(self.page.driver.execute_driver(script).result)
+        return self.results
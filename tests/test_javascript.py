@@ -0,0 +1,59 @@
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+import pytest
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import JavascriptException
+
+from poium import Page, CSSElement
+from poium.common.exceptions import CSSFindElementError
+from poium.javascript import ELEMENT_JS
+
+
+class CSSPage(Page):
+    elem = CSSElement('#kw[name="wd"]', index=1)
+
+
+@pytest.fixture()
+def webdriver():
+    return mock.Mock(spec=WebDriver)
+
+
+class TestArguments:
+
+    def test_set_text_with_quotes(self, webdriver):
+        page = CSSPage(webdriver)
+        page.elem.set_text('say "hi"')
+        webdriver.execute_script.assert_called_once_with(
+            ELEMENT_JS + """elm.style.border="2px solid red";
+                    elm.value = arguments[2];""",
+            '#kw[name="wd"]', 1, 'say "hi"')
+
+    def test_set_attribute(self, webdriver):
+        page = CSSPage(webdriver)
+        page.elem.set_attribute("data-x", 3)
+        webdriver.execute_script.assert_called_once_with(
+            ELEMENT_JS + "elm.setAttribute(arguments[2], arguments[3]);",
+            '#kw[name="wd"]', 1, "data-x", "3")
+
+    def test_click_no_arguments(self, webdriver):
+        page = CSSPage(webdriver)
+        page.elem.click_parent()
+        webdriver.execute_script.assert_called_once_with(
+            ELEMENT_JS + "elm.parentElement.click();", '#kw[name="wd"]', 1)
+
+    def test_scroll(self, webdriver):
+        page = CSSPage(webdriver)
+        page.elem.scroll(top=100, left="elm.scrollWidth")
+        assert webdriver.execute_script.call_args_list == [
+            mock.call(ELEMENT_JS + "elm.scrollTop=arguments[2];", '#kw[name="wd"]', 1, 100),
+            mock.call(ELEMENT_JS + "elm.scrollLeft=elm.scrollWidth;", '#kw[name="wd"]', 1),
+        ]
+
+    def test_script_error(self, webdriver):
+        webdriver.execute_script.side_effect = JavascriptException()
+        page = CSSPage(webdriver)
+        with pytest.raises(CSSFindElementError):
+            page.elem.click()
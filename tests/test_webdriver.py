@@ -0,0 +1,492 @@
+import json
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+import asyncio
+import pytest
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.chrome.webdriver import WebDriver as ChromeDriver
+from selenium.webdriver.remote.webelement import WebElement
+from appium.webdriver.webdriver import WebDriver as AppiumDriver
+from selenium.common.exceptions import NoSuchWindowException
+from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import NoAlertPresentException
+
+from poium import Page
+
+
+@pytest.fixture()
+def webdriver():
+    return mock.Mock(spec=WebDriver)
+
+
+@pytest.fixture()
+def chromedriver():
+    driver = mock.Mock(spec=ChromeDriver)
+    driver.current_url = "https://example.com/a/b"
+    return driver
+
+
+class TestAddCookies:
+
+    def test_cdp_single_command(self, chromedriver):
+        page = Page(chromedriver)
+        page.add_cookies([
+            {'name': 'foo', 'value': 'bar', 'expiry': 1600000000},
+            {'name': 'baz', 'value': 'qux', 'domain': 'example.com', 'path': '/a'},
+        ])
+        chromedriver.add_cookie.assert_not_called()
+        chromedriver.execute_cdp_cmd.assert_called_once_with("Network.setCookies", {"cookies": [
+            {'name': 'foo', 'value': 'bar', 'expires': 1600000000,
+             'path': '/', 'url': 'https://example.com/a/b'},
+            {'name': 'baz', 'value': 'qux', 'domain': 'example.com', 'path': '/a'},
+        ]})
+
+    def test_fallback_per_cookie(self, webdriver):
+        page = Page(webdriver)
+        cookies = [{'name': 'foo', 'value': 'bar'}, {'name': 'baz', 'value': 'qux'}]
+        page.add_cookies(cookies)
+        assert webdriver.add_cookie.call_args_list == [mock.call(c) for c in cookies]
+
+    def test_bad_cookie_type(self, webdriver):
+        page = Page(webdriver)
+        with pytest.raises(TypeError):
+            page.add_cookies([{'name': 'foo', 'value': 'bar'}, "baz"])
+        webdriver.add_cookie.assert_not_called()
+
+
+class TestContextCache:
+
+    def test_skip_current_context(self, webdriver):
+        page = Page(webdriver)
+        page.switch_to_app()
+        page.switch_to_app()
+        webdriver.switch_to.context.assert_called_once_with('NATIVE_APP')
+
+    def test_shared_by_pages(self, webdriver):
+        page_a = Page(webdriver)
+        page_b = Page(webdriver)
+        page_a.switch_to_web('WEBVIEW_x')
+        page_b.switch_to_app()
+        page_a.switch_to_web('WEBVIEW_x')
+        assert webdriver.switch_to.context.call_args_list == [
+            mock.call('WEBVIEW_x'), mock.call('NATIVE_APP'), mock.call('WEBVIEW_x')]
+
+    def test_invalidate_context(self, webdriver):
+        page = Page(webdriver)
+        page.switch_to_app()
+        page.invalidate_context()
+        page.switch_to_app()
+        assert webdriver.switch_to.context.call_count == 2
+
+
+class TestWindowCache:
+
+    def test_index_uses_read_handles(self, webdriver):
+        webdriver.window_handles = ['h0', 'h1']
+        page = Page(webdriver)
+        handles = page.window_handles
+        webdriver.window_handles = ['h1', 'h2']
+        page.switch_to_window(1)
+        webdriver.switch_to.window.assert_called_once_with(handles[1])
+
+    def test_switch_does_not_remember_handles(self, webdriver):
+        webdriver.window_handles = ['h0', 'h1']
+        page = Page(webdriver)
+        page.switch_to_window(1)
+        webdriver.window_handles = ['h1', 'h2']
+        page.switch_to_window(1)
+        assert webdriver.switch_to.window.call_args_list == [mock.call('h1'), mock.call('h2')]
+
+    def test_index_out_of_range_refreshes(self, webdriver):
+        webdriver.window_handles = ['h0']
+        page = Page(webdriver)
+        page.window_handles
+        webdriver.window_handles = ['h0', 'h1']
+        page.switch_to_window(1)
+        webdriver.switch_to.window.assert_called_with('h1')
+
+    def test_negative_index_refreshes(self, webdriver):
+        webdriver.window_handles = ['h0', 'h1']
+        page = Page(webdriver)
+        page.window_handles
+        webdriver.window_handles = ['h0', 'h1', 'h2']
+        page.switch_to_window(-1)
+        webdriver.switch_to.window.assert_called_with('h2')
+
+    def test_closed_handle_retries(self, webdriver):
+        webdriver.window_handles = ['h0', 'h1']
+        page = Page(webdriver)
+        page.window_handles
+        webdriver.window_handles = ['h0', 'h2']
+        webdriver.switch_to.window.side_effect = [NoSuchWindowException(), None]
+        page.switch_to_window(1)
+        webdriver.switch_to.window.assert_called_with('h2')
+
+
+class TestActions:
+
+    def test_batch_one_request(self, webdriver):
+        webdriver.w3c = True
+        page = Page(webdriver)
+        with page.action_batch():
+            page.move_by_offset(10, 20, click=True)
+            page.release()
+            webdriver.execute.assert_not_called()
+        webdriver.execute.assert_called_once()
+
+    def test_batch_discarded_on_error(self, webdriver):
+        webdriver.w3c = True
+        page = Page(webdriver)
+        with pytest.raises(ValueError):
+            with page.action_batch():
+                page.move_by_offset(10, 20)
+                raise ValueError()
+        webdriver.execute.assert_not_called()
+        page.release()
+        assert webdriver.execute.call_count == 1
+
+    def test_top_new_action_per_call(self, webdriver):
+        page = Page(webdriver)
+        webdriver.execute.side_effect = [WebDriverException(), None]
+        with pytest.raises(WebDriverException):
+            page.top(None, 1, 2, 1)
+        page.top(None, 3, 4, 1)
+        webdriver.execute.assert_called_with('touchAction', {'actions': [
+            {'action': 'tap', 'options': {'x': 3, 'y': 4, 'count': 1}}]})
+
+
+class TestWindowSize:
+
+    def test_skip_same_size(self, webdriver):
+        page = Page(webdriver)
+        page.set_window_size(800, 600)
+        page.set_window_size(800, 600)
+        webdriver.set_window_size.assert_called_once_with(800, 600)
+
+    def test_maximize_clears_size(self, webdriver):
+        page = Page(webdriver)
+        page.set_window_size(800, 600)
+        page.set_window_size()
+        page.set_window_size(800, 600)
+        webdriver.maximize_window.assert_called_once_with()
+        assert webdriver.set_window_size.call_count == 2
+
+    def test_shared_by_pages(self, webdriver):
+        page_a = Page(webdriver)
+        page_b = Page(webdriver)
+        page_a.set_window_size(800, 600)
+        page_b.set_window_size(1024, 768)
+        page_a.set_window_size(800, 600)
+        assert webdriver.set_window_size.call_count == 3
+
+    def test_switch_window_clears_size(self, webdriver):
+        page = Page(webdriver)
+        page.set_window_size(800, 600)
+        page.switch_to_window('h1')
+        page.set_window_size(800, 600)
+        assert webdriver.set_window_size.call_count == 2
+
+
+class TestTimeouts:
+
+    def test_skip_same_timeout(self, webdriver):
+        page = Page(webdriver)
+        page.wait(10)
+        page.wait(10)
+        page.wait_script_timeout(3)
+        page.wait_script_timeout(3)
+        page.wait_page_load_timeout(30)
+        page.wait_page_load_timeout(30)
+        webdriver.implicitly_wait.assert_called_once_with(10)
+        webdriver.set_script_timeout.assert_called_once_with(3)
+        webdriver.set_page_load_timeout.assert_called_once_with(30)
+
+    def test_get_restores_implicit_wait(self, webdriver):
+        page_a = Page(webdriver)
+        page_b = Page(webdriver)
+        page_a.get('/foo')
+        page_b.wait(20)
+        page_a.get('/bar')
+        assert webdriver.implicitly_wait.call_args_list == [mock.call(5), mock.call(20), mock.call(5)]
+
+    def test_get_skips_same_implicit_wait(self, webdriver):
+        page = Page(webdriver)
+        page.get('/foo')
+        page.get('/bar')
+        webdriver.implicitly_wait.assert_called_once_with(5)
+
+
+class TestWindowScroll:
+
+    def test_numbers_as_arguments(self, webdriver):
+        page = Page(webdriver)
+        page.window_scroll(height=300)
+        webdriver.execute_script.assert_called_once_with(
+            "window.scrollTo(arguments[0], arguments[1]);", 0, 300)
+
+    def test_javascript_expression(self, webdriver):
+        page = Page(webdriver)
+        page.window_scroll(0, "document.body.scrollHeight")
+        webdriver.execute_script.assert_called_once_with(
+            "window.scrollTo(0,document.body.scrollHeight);")
+
+
+class TestSleep:
+
+    def test_sleep_blocks(self):
+        with mock.patch('poium.webdriver.time.sleep') as sleep:
+            assert Page.sleep(1) is None
+        sleep.assert_called_once_with(1)
+
+    def test_asleep(self):
+        loop = asyncio.new_event_loop()
+        try:
+            with mock.patch('poium.webdriver.asyncio.sleep', side_effect=asyncio.sleep) as sleep:
+                loop.run_until_complete(Page.asleep(0))
+        finally:
+            loop.close()
+        sleep.assert_called_once_with(0)
+
+
+class TestPageMeta:
+
+    def test_title_and_url_one_script(self, webdriver):
+        webdriver.execute_script.return_value = ["title", "http://example.com"]
+        page = Page(webdriver)
+        assert page.get_page_meta() == ("title", "http://example.com")
+        webdriver.execute_script.assert_called_once_with("return [document.title, document.URL];")
+
+    def test_title_and_url_not_cached(self, webdriver):
+        page = Page(webdriver)
+        webdriver.execute_script.return_value = "http://x/home"
+        assert page.get_url == "http://x/home"
+        webdriver.execute_script.return_value = "http://x/login"
+        assert page.get_url == "http://x/login"
+
+    def test_version_shared_by_pages(self, webdriver):
+        home = Page(webdriver)
+        login = Page(webdriver)
+        version = home._nav_version
+        login.get("http://x/login")
+        assert home._nav_version > version
+
+
+class TestBatch:
+
+    @pytest.fixture()
+    def appiumdriver(self):
+        driver = mock.Mock(spec=AppiumDriver)
+        driver.execute_driver.return_value.result = [None, None]
+        return driver
+
+    def batch_ops(self, driver):
+        script = driver.execute_driver.call_args[0][0]
+        head, tail = script.split("\n", 1)
+        assert head.startswith("const ops = ") and head.endswith(";")
+        assert tail == (
+            "const results = [];\n"
+            "for (const op of ops) {\n"
+            "    results.push(await driver[op.name](...op.args));\n"
+            "}\n"
+            "return results;")
+        return json.loads(head[len("const ops = "):-1])
+
+    def test_one_request(self, appiumdriver):
+        page = Page(appiumdriver)
+        with page.batch() as batch:
+            batch.window_scroll(0, 300)
+            batch.add_cookie({'name': 'foo', 'value': 'bar'})
+        appiumdriver.execute_driver.assert_called_once()
+        assert batch.results == [None, None]
+        assert self.batch_ops(appiumdriver) == [
+            {"name": "execute", "args": ["window.scrollTo(arguments[0], arguments[1]);", 0, 300]},
+            {"name": "addCookie", "args": [{'name': 'foo', 'value': 'bar'}]},
+        ]
+
+    def test_scroll_expression(self, appiumdriver):
+        page = Page(appiumdriver)
+        with page.batch() as batch:
+            batch.window_scroll(0, "document.body.scrollHeight")
+        assert self.batch_ops(appiumdriver) == [
+            {"name": "execute", "args": ["window.scrollTo(0,document.body.scrollHeight);"]},
+        ]
+
+    def test_move_by_offset(self, appiumdriver):
+        page = Page(appiumdriver)
+        with page.batch() as batch:
+            batch.move_by_offset(10, 20, click=True)
+        assert self.batch_ops(appiumdriver) == [{"name": "performActions", "args": [[{
+            "type": "pointer",
+            "id": "mouse",
+            "parameters": {"pointerType": "mouse"},
+            "actions": [
+                {"type": "pointerMove", "duration": 250, "origin": "pointer", "x": 10, "y": 20},
+                {"type": "pointerDown", "button": 0},
+                {"type": "pointerUp", "button": 0},
+            ],
+        }]]}]
+
+    def test_touch(self, appiumdriver):
+        elem = mock.Mock(spec=WebElement)
+        elem.id = "element-1"
+        page = Page(appiumdriver)
+        with page.batch() as batch:
+            batch.top(elem, 1, 2, 1)
+            batch.swipe(100, 800, 100, 200, 500)
+        assert self.batch_ops(appiumdriver) == [
+            {"name": "touchPerform", "args": [[
+                {"action": "tap", "options": {"element": "element-1", "x": 1, "y": 2, "count": 1}},
+            ]]},
+            {"name": "touchPerform", "args": [[
+                {"action": "press", "options": {"x": 100, "y": 800}},
+                {"action": "wait", "options": {"ms": 500}},
+                {"action": "moveTo", "options": {"x": 100, "y": 200}},
+                {"action": "release", "options": {}},
+            ]]},
+        ]
+
+    def test_other_methods_run_in_order(self, appiumdriver):
+        page = Page(appiumdriver)
+        calls = []
+
+        def execute_driver(script):
+            calls.append(self.batch_ops(appiumdriver))
+            return mock.Mock(result=[None])
+
+        appiumdriver.execute_driver.side_effect = execute_driver
+        appiumdriver.switch_to.context.side_effect = lambda name: calls.append(name)
+        with page.batch() as batch:
+            batch.window_scroll(0, 300)
+            batch.switch_to_app()
+            batch.window_scroll(0, 600)
+        assert calls == [
+            [{"name": "execute", "args": ["window.scrollTo(arguments[0], arguments[1]);", 0, 300]}],
+            'NATIVE_APP',
+            [{"name": "execute", "args": ["window.scrollTo(arguments[0], arguments[1]);", 0, 600]}],
+        ]
+        assert batch.results == [None, None]
+
+    def test_empty_batch(self, appiumdriver):
+        page = Page(appiumdriver)
+        with page.batch() as batch:
+            pass
+        appiumdriver.execute_driver.assert_not_called()
+        assert batch.results == []
+
+    def test_not_sent_on_error(self, appiumdriver):
+        page = Page(appiumdriver)
+        with pytest.raises(ValueError):
+            with page.batch() as batch:
+                batch.window_scroll(0, 300)
+                raise ValueError()
+        appiumdriver.execute_driver.assert_not_called()
+
+
+class TestSwipeBatch:
+
+    def test_one_actions_request(self, webdriver):
+        page = Page(webdriver)
+        page.swipe_batch([(1, 2, 3, 4, 500), (5, 6, 7, 8, None)])
+        webdriver.execute.assert_called_once_with('actions', {'actions': [{
+            'type': 'pointer',
+            'parameters': {'pointerType': 'touch'},
+            'id': 'touch',
+            'actions': [
+                {'type': 'pointerMove', 'duration': 250, 'x': 1, 'y': 2, 'origin': 'viewport'},
+                {'type': 'pointerDown', 'duration': 0, 'button': 0},
+                {'type': 'pause', 'duration': 500},
+                {'type': 'pointerMove', 'duration': 250, 'x': 3, 'y': 4, 'origin': 'viewport'},
+                {'type': 'pointerUp', 'duration': 0, 'button': 0},
+                {'type': 'pause', 'duration': 100},
+                {'type': 'pointerMove', 'duration': 250, 'x': 5, 'y': 6, 'origin': 'viewport'},
+                {'type': 'pointerDown', 'duration': 0, 'button': 0},
+                {'type': 'pause', 'duration': 0},
+                {'type': 'pointerMove', 'duration': 250, 'x': 7, 'y': 8, 'origin': 'viewport'},
+                {'type': 'pointerUp', 'duration': 0, 'button': 0},
+                {'type': 'pause', 'duration': 100},
+            ],
+        }]})
+
+
+class TestCookieCache:
+
+    def test_reads_cached(self, webdriver):
+        webdriver.get_cookies.return_value = [{'name': 'foo', 'value': 'bar'}]
+        page = Page(webdriver)
+        assert page.get_cookies() == [{'name': 'foo', 'value': 'bar'}]
+        assert page.get_cookie('foo') == {'name': 'foo', 'value': 'bar'}
+        assert page.get_cookie('baz') is None
+        webdriver.get_cookies.assert_called_once_with()
+
+    def test_mutation_invalidates(self, webdriver):
+        webdriver.get_cookies.return_value = []
+        page = Page(webdriver)
+        page.get_cookies()
+        page.add_cookie({'name': 'foo', 'value': 'bar'})
+        page.get_cookies()
+        page.delete_all_cookies()
+        page.get_cookies()
+        assert webdriver.get_cookies.call_count == 3
+
+    def test_shared_by_pages(self, webdriver):
+        webdriver.get_cookies.return_value = [{'name': 'sid', 'value': '1'}]
+        home = Page(webdriver)
+        login = Page(webdriver)
+        assert home.get_cookie('sid') == {'name': 'sid', 'value': '1'}
+        login.delete_all_cookies()
+        webdriver.get_cookies.return_value = []
+        assert home.get_cookies() == []
+        assert webdriver.get_cookies.call_count == 2
+
+    def test_expires(self, webdriver):
+        webdriver.get_cookies.return_value = []
+        page = Page(webdriver)
+        with mock.patch('poium.webdriver.time.monotonic', side_effect=[0, 0.1, 1]):
+            page.get_cookie('sid')
+            page.get_cookie('sid')
+            webdriver.get_cookies.return_value = [{'name': 'sid', 'value': '1'}]
+            assert page.get_cookie('sid') == {'name': 'sid', 'value': '1'}
+        assert webdriver.get_cookies.call_count == 2
+
+    def test_first_cookie_of_name(self, webdriver):
+        webdriver.get_cookies.return_value = [
+            {'name': 'foo', 'value': '1'}, {'name': 'foo', 'value': '2'}]
+        page = Page(webdriver)
+        assert page.get_cookie('foo')['value'] == '1'
+
+    def test_returns_copies(self, webdriver):
+        webdriver.get_cookies.return_value = [{'name': 'foo', 'value': 'bar'}]
+        page = Page(webdriver)
+        page.get_cookie('foo')['value'] = 'changed'
+        page.get_cookies()[0]['value'] = 'changed'
+        assert page.get_cookie('foo') == {'name': 'foo', 'value': 'bar'}
+
+
+class TestAlertCache:
+
+    def test_open_alert_cached(self, webdriver):
+        alert = mock.PropertyMock(return_value=mock.Mock())
+        type(webdriver.switch_to).alert = alert
+        page = Page(webdriver)
+        assert page.alert_is_display() is True
+        assert page.alert_is_display() is True
+        assert alert.call_count == 1
+
+    def test_no_alert_not_cached(self, webdriver):
+        alert = mock.PropertyMock(side_effect=[NoAlertPresentException(), mock.Mock()])
+        type(webdriver.switch_to).alert = alert
+        page = Page(webdriver)
+        assert page.alert_is_display() is False
+        assert page.alert_is_display() is True
+
+    def test_accept_shared_by_pages(self, webdriver):
+        alert = mock.PropertyMock(side_effect=[mock.Mock(), mock.Mock(), NoAlertPresentException()])
+        type(webdriver.switch_to).alert = alert
+        page_a = Page(webdriver)
+        page_b = Page(webdriver)
+        assert page_b.alert_is_display() is True
+        page_a.accept_alert()
+        assert page_b.alert_is_display() is False